@@ -30,6 +30,9 @@ setup(
     install_requires=[
         "playwright>=1.40.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.0"],
+    },
     entry_points={
         "console_scripts": [
             "claude-chat-extractor=claude_chat_extractor.extractor:main",
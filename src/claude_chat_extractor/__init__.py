@@ -1,6 +1,6 @@
 """Claude Chat Extractor - Extract and consolidate shared Claude conversations."""
 
-from .extractor import fetch_chat, consolidate_markdown
+from .extractor import ChatExtractor, fetch_chat, fetch_chats, consolidate_markdown
 
 __version__ = "1.0.0"
-__all__ = ["fetch_chat", "consolidate_markdown"]
+__all__ = ["ChatExtractor", "fetch_chat", "fetch_chats", "consolidate_markdown"]
@@ -11,171 +11,472 @@ Usage:
     claude-chat-extractor <CHAT_URL> --format pdf
 """
 
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
 import argparse
+import asyncio
+import inspect
+import io
 import json
+import os
 import re
 import shutil
+import threading
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install claude-chat-extractor[fast]
+    orjson = None
 
-def fetch_chat(url: str, work_dir: Path, format_type: str, keep_html: bool = False):
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+BROWSER_ARGS = ['--disable-dev-shm-usage', '--disable-gpu']
+
+# Stylesheets stay enabled: innerText depends on CSS visibility rules
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font'}
+
+ARTIFACT_FILE_RE = re.compile(r'artifact_code_(\d+)')
+UNSAFE_EXT_RE = re.compile(r'[^A-Za-z0-9_]')
+
+# Scrolls to the bottom and reports [page height, message count]; both stop
+# changing once lazy loading has finished
+SCROLL_TO_BOTTOM_JS = """
+    () => {
+        window.scrollTo(0, document.body.scrollHeight);
+        return [document.body.scrollHeight, document.querySelectorAll('[data-test-render-count]').length];
+    }
+"""
+SCROLL_SETTLE_INTERVAL_MS = 250
+SCROLL_SETTLE_ROUNDS = 8
+
+MESSAGE_TEMPLATES = {
+    'user': "\n### 👤 **User**\n\n{content}\n\n---\n",
+    'assistant': "\n### 🤖 **Claude**\n\n{content}\n\n---\n",
+}
+
+# Returns a JSON string: serializing in the page is far cheaper than
+# Playwright marshalling the object graph across the CDP bridge.
+EXTRACT_CHAT_JS = """
+    () => {
+        const messages = [];
+
+        // Prefer the already-serialized hydration payload: it avoids innerText,
+        // which forces a layout pass per message container
+        const findChatMessages = (node) => {
+            if (!node || typeof node !== 'object') return null;
+            if (Array.isArray(node.chat_messages)) return node.chat_messages;
+            for (const key in node) {
+                const found = findChatMessages(node[key]);
+                if (found) return found;
+            }
+            return null;
+        };
+        let hydrated = null;
+        const nextData = document.getElementById('__NEXT_DATA__');
+        if (nextData) {
+            try {
+                hydrated = findChatMessages(JSON.parse(nextData.textContent));
+            } catch (e) {
+                hydrated = null;
+            }
+        }
+
+        if (hydrated && hydrated.length) {
+            for (let i = 0; i < hydrated.length; i++) {
+                const msg = hydrated[i];
+                let text = msg.text;
+                if (!text && Array.isArray(msg.content)) {
+                    text = msg.content.filter(c => c.type === 'text').map(c => c.text).join('\\n\\n');
+                }
+                if (!text || text.length <= 10) continue;
+                messages.push({index: i, role: msg.sender === 'human' ? 'user' : 'assistant', content: text.trim()});
+            }
+        } else {
+            const containers = document.querySelectorAll('[data-test-render-count]');
+            for (let i = 0; i < containers.length; i++) {
+                const el = containers[i];
+                const text = el.innerText || el.textContent;
+                if (!text || text.length <= 10) continue;
+                // Anything not marked as a user message is Claude's
+                const isUser = el.className.includes('user') || el.querySelector('.font-user-message') !== null;
+                messages.push({index: i, role: isUser ? 'user' : 'assistant', content: text.trim()});
+            }
+        }
+
+        const artifacts = [];
+        const blocks = document.querySelectorAll('pre code');
+        for (let i = 0; i < blocks.length; i++) {
+            const block = blocks[i];
+            const code = block.textContent;
+            if (!code || code.length <= 50) continue;
+            let language = 'text';
+            for (const cls of block.classList) {
+                if (cls.startsWith('language-')) {
+                    language = cls.slice(9) || 'text';
+                    break;
+                }
+            }
+            artifacts.push({index: i, content: code, language: language});
+        }
+
+        return JSON.stringify({messages, artifacts});
+    }
+"""
+
+
+class _NoStackInspect:
+    """Proxy for the inspect module whose stack() skips frame walking."""
+
+    def __getattr__(self, name):
+        return getattr(inspect, name)
+
+    @staticmethod
+    def stack(context=1):
+        return []
+
+
+def _skip_playwright_stack_capture():
     """
-    Fetch Claude chat content using Playwright.
+    Stop Playwright from calling inspect.stack() on every API call.
+
+    Older Playwright releases build per-call tracing metadata this way, and
+    reading source context for each frame dominates CPU in scraping loops.
+    The cost is that Playwright errors lose their "Page.goto:" style prefix,
+    so this is only applied by the CLI, never on import. Set
+    PW_INSPECT_STACK=1 to keep the default behaviour.
+    """
+    if os.environ.get('PW_INSPECT_STACK', '0') != '0':
+        return
+    try:
+        import playwright._impl._connection as pw_connection
+    except ImportError:  # private module moved; nothing to patch
+        return
+    pw_connection.inspect = _NoStackInspect()
+
+
+async def _prompt(message: str) -> str:
+    """
+    Await a line from stdin without blocking the event loop or shutdown.
+
+    The read runs on a daemon thread rather than the default executor, since
+    asyncio.run waits for executor threads on exit and Ctrl-C would otherwise
+    hang until Enter is pressed. It reads the raw file descriptor because a
+    daemon thread parked inside input() holds sys.stdin's buffer lock, which
+    aborts interpreter shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def deliver(method, value):
+        if not future.done():
+            method(value)
+
+    def read():
+        try:
+            line = b''
+            while not line.endswith(b'\n'):
+                chunk = os.read(0, 1024)
+                if not chunk:
+                    raise EOFError("stdin closed")
+                line += chunk
+            value, method = line.decode('utf-8', 'replace').rstrip('\r\n'), future.set_result
+        except Exception as e:
+            value, method = e, future.set_exception
+        try:
+            loop.call_soon_threadsafe(deliver, method, value)
+        except RuntimeError:  # loop already closed
+            pass
+
+    print(message, end='', flush=True)
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+
+def _dump_json(data) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+async def _block_resources(route):
+    """Abort requests for resources that text extraction never uses."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _extract_chat(browser, url: str, work_dir: Path, format_type: str,
+                        keep_html: bool = False, keep_artifacts: bool = False,
+                        interactive: bool = False, prompt_lock: asyncio.Lock = None):
+    """
+    Extract a single chat using its own context on a shared browser.
 
     Args:
+        browser: Running Playwright browser
         url: Claude share URL
         work_dir: Directory for intermediate files
         format_type: Output format ('markdown' or 'pdf')
         keep_html: Whether to keep HTML file after processing
+        keep_artifacts: Whether to write individual artifact files
+        interactive: Whether to pause for manual CAPTCHA handling
+        prompt_lock: Lock shared by concurrent extractions so only one
+            CAPTCHA prompt waits on the terminal at a time
 
     Returns:
         dict: Metadata about the extraction
     """
-    work_dir.mkdir(exist_ok=True)
+    work_dir.mkdir(parents=True, exist_ok=True)
 
     print(f"🌐 Fetching chat from: {url}")
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        )
-        page = context.new_page()
+    # One context per chat; closing it releases the requests and responses
+    # Playwright keeps for its lifetime, which matters in batch runs
+    context = await browser.new_context(user_agent=USER_AGENT)
+    try:
+        # PDFs and interactive CAPTCHA solving (image challenges) need the full
+        # page rendering, so only block resources for unattended markdown runs
+        if format_type != 'pdf' and not interactive:
+            await context.route("**/*", _block_resources)
+
+        page = await context.new_page()
 
         # Navigate with error handling
         try:
-            page.goto(url, timeout=60000)
+            await page.goto(url, timeout=60000)
         except Exception as e:
             print(f"⚠️  Navigation warning: {e}")
 
-        # Manual CAPTCHA handling
-        print("\n⏳ Waiting for page to load...")
-        print("   If you see a CAPTCHA or verification, please complete it.")
-        input("   Press Enter once the chat content is fully loaded... ")
+        if interactive:
+            # Manual CAPTCHA handling (the prompt runs off the event loop so other pages keep loading)
+            async with prompt_lock or asyncio.Lock():
+                print(f"\n⏳ Waiting for page to load: {url}")
+                print("   If you see a CAPTCHA or verification, please complete it.")
+                await _prompt("   Press Enter once the chat content is fully loaded... ")
+        else:
+            try:
+                await page.wait_for_selector('[data-test-render-count]', timeout=30000)
+            except Exception as e:
+                print(f"⚠️  Content wait warning: {e}")
 
         print("📄 Extracting content...")
 
-        # Scroll to load lazy content
-        page.evaluate("window.scrollTo(0, document.body.scrollHeight);")
-        page.wait_for_timeout(2000)
-
-        # Save HTML (intermediate)
-        html_content = page.content()
-        html_path = work_dir / "chat_complete.html"
-        html_path.write_text(html_content, encoding='utf-8')
-
-        # Generate PDF if requested
+        # Scroll to load lazy content, re-scrolling until the page stops growing
+        # (capped at the 2 s the old fixed wait took)
+        previous = None
+        for _ in range(SCROLL_SETTLE_ROUNDS):
+            current = await page.evaluate(SCROLL_TO_BOTTOM_JS)
+            if current == previous:
+                break
+            previous = current
+            await page.wait_for_timeout(SCROLL_SETTLE_INTERVAL_MS)
+
+        # Each of these serializes the whole document, so only pay for what was asked for;
+        # extraction below reads the live DOM and needs neither
         if format_type == 'pdf':
             pdf_path = work_dir / "chat.pdf"
-            page.pdf(path=str(pdf_path), format='A4', print_background=True)
+            await page.pdf(path=str(pdf_path), format='A4', print_background=True)
             print(f"✅ PDF saved: {pdf_path}")
+        if keep_html:
+            html_path = work_dir / "chat_complete.html"
+            html_path.write_bytes((await page.content()).encode('utf-8'))
+
+        # Extract conversation messages and code artifacts in a single round-trip
+        payload = json.loads(await page.evaluate(EXTRACT_CHAT_JS))
+        messages_data = payload['messages']
+        artifacts = payload['artifacts']
+    finally:
+        await context.close()
+
+    # An empty page almost always means a CAPTCHA/challenge or a failed load,
+    # not an empty chat; never report that as a successful export
+    if not messages_data:
+        hint = "" if interactive else "; retry with --interactive to complete it manually"
+        raise RuntimeError(
+            f"No messages found at {url} - the page may be showing a CAPTCHA or failed to load{hint}"
+        )
 
-        # Extract conversation messages
-        messages_data = page.evaluate("""
-            () => {
-                const messages = [];
-                const messageContainers = document.querySelectorAll('[data-test-render-count]');
-
-                messageContainers.forEach((el, i) => {
-                    const text = el.innerText || el.textContent;
-                    if (text && text.length > 10) {
-                        let role = 'assistant';  // Default to Claude
-                        if (el.className.includes('user') || el.querySelector('.font-user-message')) {
-                            role = 'user';
-                        }
-
-                        messages.push({
-                            index: i,
-                            role: role,
-                            content: text.trim()
-                        });
-                    }
-                });
-
-                return messages;
-            }
-        """)
+    # One timestamp so the JSON metadata and the markdown header agree
+    now = datetime.now()
 
-        # Save conversation JSON
-        metadata = {
-            'url': url,
-            'extracted_at': datetime.now().isoformat(),
-            'message_count': len(messages_data)
-        }
+    # Save conversation JSON
+    metadata = {
+        'url': url,
+        'extracted_at': now.isoformat(),
+        'message_count': len(messages_data)
+    }
 
-        json_path = work_dir / "conversation.json"
-        json_path.write_text(json.dumps({
-            'metadata': metadata,
-            'messages': messages_data
-        }, indent=2), encoding='utf-8')
-
-        # Save conversation markdown
-        md_lines = [
-            "# Claude Chat Export",
-            "",
-            f"**Source**: {url}",
-            f"**Extracted**: {len(messages_data)} messages",
-            f"**Date**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-            "---",
-            ""
-        ]
+    json_path = work_dir / "conversation.json"
+    json_path.write_bytes(_dump_json({
+        'metadata': metadata,
+        'messages': messages_data
+    }))
+
+    # Save conversation markdown
+    header = (
+        "# Claude Chat Export\n\n"
+        f"**Source**: {url}\n"
+        f"**Extracted**: {len(messages_data)} messages\n"
+        f"**Date**: {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        "---\n"
+    )
+    body = ''.join(
+        MESSAGE_TEMPLATES[msg['role']].format(content=msg['content'])
+        for msg in messages_data
+    )
 
-        for msg in messages_data:
-            role_header = "👤 **User**" if msg['role'] == 'user' else "🤖 **Claude**"
-            md_lines.extend([f"### {role_header}", "", msg['content'], "", "---", ""])
+    conversation_text = header + body
 
+    # Save conversation and artifacts (consolidation works from memory; files are only for inspection)
+    if keep_artifacts:
         md_path = work_dir / "conversation.md"
-        md_path.write_text('\n'.join(md_lines), encoding='utf-8')
-
-        # Extract code artifacts
-        print("📦 Extracting artifacts...")
-        artifacts = page.evaluate("""
-            () => {
-                const codeBlocks = document.querySelectorAll('pre code');
-                const artifacts = [];
-
-                codeBlocks.forEach((block, i) => {
-                    const code = block.textContent;
-                    if (code && code.length > 50) {
-                        const language = block.className.replace('language-', '') || 'text';
-                        artifacts.push({
-                            index: i,
-                            content: code,
-                            language: language
-                        });
-                    }
-                });
-
-                return artifacts;
-            }
-        """)
+        md_path.write_bytes(conversation_text.encode('utf-8'))
 
-        # Save artifacts
         for artifact in artifacts:
-            ext = artifact.get('language', 'txt')
+            ext = UNSAFE_EXT_RE.sub('', artifact.get('language', 'txt')) or 'txt'
             artifact_path = work_dir / f"artifact_code_{artifact['index']}.{ext}"
-            artifact_path.write_text(artifact['content'], encoding='utf-8')
+            artifact_path.write_bytes(artifact['content'].encode('utf-8'))
 
-        print(f"   Found {len(artifacts)} code artifacts")
+    print(f"   Found {len(artifacts)} code artifacts")
 
-        browser.close()
+    return {
+        'metadata': metadata,
+        'artifact_count': len(artifacts),
+        'artifacts': artifacts,
+        'conversation_text': conversation_text,
+        'work_dir': work_dir
+    }
 
-        # Cleanup HTML if not keeping
-        if not keep_html:
-            html_path.unlink(missing_ok=True)
-            print("   Cleaned up HTML file")
 
-        return {
-            'metadata': metadata,
-            'artifact_count': len(artifacts),
-            'work_dir': work_dir
-        }
+class ChatExtractor:
+    """
+    Keep one Playwright browser alive across several extractions.
 
+    Each fetch() runs in a fresh browser context that is closed afterwards,
+    so chats never share cookies, but Chromium only cold-starts once.
 
-def consolidate_markdown(work_dir: Path, output_file: Path, keep_artifacts: bool = False):
+    Usage:
+        async with ChatExtractor() as extractor:
+            first = await extractor.fetch(url_1, Path('chat_1'))
+            second = await extractor.fetch(url_2, Path('chat_2'))
+    """
+
+    def __init__(self, headless: bool = True):
+        self.headless = headless
+        self._playwright = None
+        self._browser = None
+        self._prompt_lock = None
+
+    async def __aenter__(self):
+        self._prompt_lock = asyncio.Lock()
+        self._playwright = await async_playwright().start()
+        try:
+            self._browser = await self._playwright.chromium.launch(
+                headless=self.headless, args=BROWSER_ARGS
+            )
+        except Exception:
+            await self._playwright.stop()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            await self._browser.close()
+        finally:
+            await self._playwright.stop()
+            self._browser = None
+            self._playwright = None
+
+    async def fetch(self, url: str, work_dir: Path, format_type: str = 'markdown',
+                    keep_html: bool = False, keep_artifacts: bool = False,
+                    interactive: bool = False):
+        """
+        Fetch a Claude chat using the shared browser.
+
+        Args:
+            url: Claude share URL
+            work_dir: Directory for intermediate files
+            format_type: Output format ('markdown' or 'pdf')
+            keep_html: Whether to keep HTML file after processing
+            keep_artifacts: Whether to write individual artifact files
+            interactive: Whether to pause for manual CAPTCHA handling
+
+        Returns:
+            dict: Metadata about the extraction
+        """
+        return await _extract_chat(self._browser, url, work_dir, format_type,
+                                   keep_html=keep_html, keep_artifacts=keep_artifacts,
+                                   interactive=interactive, prompt_lock=self._prompt_lock)
+
+
+async def fetch_chat(url: str, work_dir: Path, format_type: str, keep_html: bool = False,
+                     keep_artifacts: bool = False, interactive: bool = False, headless: bool = True):
+    """
+    Fetch Claude chat content using Playwright.
+
+    Args:
+        url: Claude share URL
+        work_dir: Directory for intermediate files
+        format_type: Output format ('markdown' or 'pdf')
+        keep_html: Whether to keep HTML file after processing
+        keep_artifacts: Whether to write individual artifact files
+        interactive: Whether to pause for manual CAPTCHA handling
+        headless: Whether to run the browser without a visible window
+
+    Returns:
+        dict: Metadata about the extraction
+    """
+    async with ChatExtractor(headless=headless) as extractor:
+        return await extractor.fetch(url, work_dir, format_type, keep_html=keep_html,
+                                     keep_artifacts=keep_artifacts, interactive=interactive)
+
+
+async def fetch_chats(urls, work_dir: Path, format_type: str = 'markdown', keep_html: bool = False,
+                      keep_artifacts: bool = False, interactive: bool = False, headless: bool = True,
+                      max_concurrency: int = 5):
+    """
+    Fetch several Claude chats concurrently within a single browser.
+
+    Each URL gets its own browser context and its own subdirectory
+    (chat_1, chat_2, ...) under work_dir.
+
+    Args:
+        urls: Claude share URLs
+        work_dir: Parent directory for per-chat intermediate files
+        format_type: Output format ('markdown' or 'pdf')
+        keep_html: Whether to keep HTML files after processing
+        keep_artifacts: Whether to write individual artifact files
+        interactive: Whether to pause for manual CAPTCHA handling
+        headless: Whether to run the browser without a visible window
+        max_concurrency: Maximum number of pages loading at once
+
+    Returns:
+        list: Extraction metadata for each URL, in input order; a URL that
+            failed has its exception in place of the metadata
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async with ChatExtractor(headless=headless) as extractor:
+
+        async def fetch_one(index: int, url: str):
+            async with semaphore:
+                return await extractor.fetch(url, work_dir / f"chat_{index}", format_type,
+                                             keep_html=keep_html, keep_artifacts=keep_artifacts,
+                                             interactive=interactive)
+
+        # Collect failures per URL so one bad page neither discards the finished
+        # results nor closes the browser under tasks that are still running
+        return await asyncio.gather(
+            *(fetch_one(i, url) for i, url in enumerate(urls, start=1)),
+            return_exceptions=True
+        )
+
+
+def consolidate_markdown(work_dir: Path, output_file: Path, keep_artifacts: bool = False,
+                         artifacts=None, conversation_text: str = None):
     """
     Consolidate conversation and artifacts into single markdown file.
 
@@ -183,15 +484,20 @@ def consolidate_markdown(work_dir: Path, output_file: Path, keep_artifacts: bool
         work_dir: Directory containing chat export files
         output_file: Path for consolidated output
         keep_artifacts: Whether to keep individual artifact files
+        artifacts: Artifacts as returned by fetch_chat; read from
+            artifact_code_* files in work_dir when omitted
+        conversation_text: Conversation markdown as returned by fetch_chat;
+            read from conversation.md in work_dir when omitted
     """
     print(f"\n📝 Consolidating to: {output_file}")
 
     # Read conversation
     conversation_md = work_dir / "conversation.md"
-    if not conversation_md.exists():
-        raise FileNotFoundError(f"conversation.md not found in {work_dir}")
+    if conversation_text is None:
+        if not conversation_md.exists():
+            raise FileNotFoundError(f"conversation.md not found in {work_dir}")
 
-    conversation_text = conversation_md.read_text(encoding='utf-8')
+        conversation_text = conversation_md.read_text(encoding='utf-8')
 
     # Read JSON metadata
     json_path = work_dir / "conversation.json"
@@ -200,81 +506,70 @@ def consolidate_markdown(work_dir: Path, output_file: Path, keep_artifacts: bool
         data = json.loads(json_path.read_text(encoding='utf-8'))
         metadata = data.get('metadata', {})
 
-    # Collect artifacts
-    artifact_files = sorted(work_dir.glob("artifact_code_*.*"))
-    artifacts = {}
-
-    for artifact_file in artifact_files:
-        match = re.search(r'artifact_code_(\d+)', artifact_file.name)
-        if match:
-            artifact_num = match.group(1)
-            ext = artifact_file.suffix.lstrip('.')
-            artifacts[artifact_num] = {
-                'content': artifact_file.read_text(encoding='utf-8'),
-                'language': ext
-            }
+    # Collect artifacts as (number, content, language), sorted once by number
+    if artifacts is not None:
+        artifact_files = []
+        artifacts = [
+            (artifact['index'], artifact['content'], artifact.get('language', 'txt'))
+            for artifact in artifacts
+        ]
+    else:
+        artifact_files = sorted(work_dir.glob("artifact_code_*.*"))
+        artifacts = []
+
+        for artifact_file in artifact_files:
+            match = ARTIFACT_FILE_RE.match(artifact_file.name)
+            if match:
+                artifacts.append((
+                    int(match.group(1)),
+                    artifact_file.read_text(encoding='utf-8'),
+                    artifact_file.suffix.lstrip('.')
+                ))
+
+    artifacts.sort(key=itemgetter(0))
 
     # Build consolidated markdown
-    lines = [
-        "# Claude Chat Export - Consolidated",
-        "",
-        f"**Exported**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        f"**Source**: {metadata.get('url', 'Unknown')}",
-        f"**Messages**: {metadata.get('message_count', 'Unknown')}",
-        f"**Artifacts**: {len(artifacts)}",
-        "",
-        "---",
-        ""
-    ]
+    now = datetime.now()
+    buf = io.StringIO()
+    w = buf.write
+
+    w("# Claude Chat Export - Consolidated\n\n"
+      f"**Exported**: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
+      f"**Source**: {metadata.get('url', 'Unknown')}\n"
+      f"**Messages**: {metadata.get('message_count', 'Unknown')}\n"
+      f"**Artifacts**: {len(artifacts)}\n\n"
+      "---\n\n")
 
     # Table of contents for artifacts
     if artifacts:
-        lines.extend([
-            "## 📦 Code Artifacts",
-            ""
-        ])
-        for num in sorted(artifacts.keys(), key=int):
-            lines.append(f"- [Artifact {num}](#artifact-{num})")
-        lines.extend(["", "---", ""])
+        w("## 📦 Code Artifacts\n\n")
+        for num, _, _ in artifacts:
+            w(f"- [Artifact {num}](#artifact-{num})\n")
+        w("\n---\n\n")
 
     # Conversation
-    lines.extend([
-        "## 💬 Conversation",
-        "",
-        conversation_text,
-        ""
-    ])
+    w("## 💬 Conversation\n\n")
+    w(conversation_text)
+    w("\n\n")
 
     # Artifacts section
     if artifacts:
-        lines.extend(["", "---", "", "## 📝 Code Artifacts - Full Content", ""])
-
-        for num in sorted(artifacts.keys(), key=int):
-            artifact = artifacts[num]
-            lang = artifact['language']
-            lines.extend([
-                f"### Artifact {num}",
-                "",
-                f"```{lang}",
-                artifact['content'],
-                "```",
-                ""
-            ])
+        w("\n---\n\n## 📝 Code Artifacts - Full Content\n\n")
+
+        for num, content, lang in artifacts:
+            w(f"### Artifact {num}\n\n```{lang}\n{content}\n```\n\n")
 
     # Footer
-    lines.extend([
-        "---",
-        "",
-        "*This document was automatically generated from a Claude chat export.*",
-        "*Ready to use as context in your next Claude conversation.*",
-        ""
-    ])
+    w("---\n\n"
+      "*This document was automatically generated from a Claude chat export.*\n"
+      "*Ready to use as context in your next Claude conversation.*\n")
 
     # Write output
-    output_file.write_text('\n'.join(lines), encoding='utf-8')
+    data = buf.getvalue().encode('utf-8')
+    output_file.write_bytes(data)
 
     print(f"✅ Consolidated markdown created:")
-    print(f"   - Size: {output_file.stat().st_size / 1024:.1f} KB")
+    print(f"   - Size: {len(data) / 1024:.1f} KB")
     print(f"   - Conversation: {len(conversation_text)} chars")
     print(f"   - Artifacts: {len(artifacts)}")
 
@@ -283,7 +578,21 @@ def consolidate_markdown(work_dir: Path, output_file: Path, keep_artifacts: bool
         for artifact_file in artifact_files:
             artifact_file.unlink()
         conversation_md.unlink(missing_ok=True)
-        print(f"   Cleaned up {len(artifact_files)} artifact files")
+        if artifact_files:
+            print(f"   Cleaned up {len(artifact_files)} artifact files")
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def _numbered_path(path: Path, number: int) -> Path:
+    """Derive a per-chat output path (e.g. chat.md -> chat_2.md) for batch runs."""
+    return path.with_name(f"{path.stem}_{number}{path.suffix}")
 
 
 def main():
@@ -302,20 +611,32 @@ Examples:
   # Generate PDF instead of markdown
   claude-chat-extractor CHAT_URL --format pdf
 
+  # Several chats at once - creates consolidated_chat_1.md, consolidated_chat_2.md, ...
+  claude-chat-extractor CHAT_URL_1 CHAT_URL_2 CHAT_URL_3
+
+  # Pause for manual CAPTCHA handling (opens a visible browser)
+  claude-chat-extractor CHAT_URL --interactive
+
+  # Watch the browser without pausing
+  claude-chat-extractor CHAT_URL --headed
+
   # Keep intermediate files for debugging
   claude-chat-extractor CHAT_URL --keep-artifacts --keep-html
         """
     )
 
     parser.add_argument(
-        'url',
-        help='Claude share URL (e.g., https://claude.ai/share/...)'
+        'urls',
+        nargs='+',
+        metavar='url',
+        help='Claude share URL(s) (e.g., https://claude.ai/share/...)'
     )
 
     parser.add_argument(
         '--output', '-o',
         type=Path,
-        help='Output file path (default: consolidated_chat.md for markdown, chat.pdf for PDF)'
+        help='Output file path (default: consolidated_chat.md for markdown, chat.pdf for PDF; '
+             'numbered per chat when several URLs are given)'
     )
 
     parser.add_argument(
@@ -344,8 +665,29 @@ Examples:
         help='Keep intermediate HTML file'
     )
 
+    parser.add_argument(
+        '--headed',
+        action='store_true',
+        help='Show the browser window (implied by --interactive)'
+    )
+
+    parser.add_argument(
+        '--interactive',
+        action='store_true',
+        help='Pause after page load so a CAPTCHA can be completed manually'
+    )
+
+    parser.add_argument(
+        '--max-concurrency',
+        type=_positive_int,
+        default=5,
+        help='Maximum number of chats fetched at once (default: 5)'
+    )
+
     args = parser.parse_args()
 
+    _skip_playwright_stack_capture()
+
     # Set default output paths
     if args.output is None:
         if args.format == 'pdf':
@@ -353,59 +695,98 @@ Examples:
         else:
             args.output = Path('consolidated_chat.md')
 
-    # Validate URL
-    if not args.url.startswith('https://claude.ai/share/'):
-        print("⚠️  Warning: URL doesn't look like a Claude share link")
-        print(f"   Expected: https://claude.ai/share/...")
-        print(f"   Got: {args.url}")
-        response = input("   Continue anyway? (y/N): ")
-        if response.lower() != 'y':
-            print("❌ Cancelled")
-            return 1
+    # Validate URLs
+    for url in args.urls:
+        if not url.startswith('https://claude.ai/share/'):
+            print("⚠️  Warning: URL doesn't look like a Claude share link")
+            print(f"   Expected: https://claude.ai/share/...")
+            print(f"   Got: {url}")
+            response = input("   Continue anyway? (y/N): ")
+            if response.lower() != 'y':
+                print("❌ Cancelled")
+                return 1
+
+    # A CAPTCHA can only be completed in a visible window
+    headless = not (args.headed or args.interactive)
+
+    if len(args.urls) == 1:
+        outputs = [args.output]
+    else:
+        outputs = [_numbered_path(args.output, i) for i in range(1, len(args.urls) + 1)]
 
     print("=" * 70)
     print("Claude Chat Extractor")
     print("=" * 70)
-    print(f"URL:        {args.url}")
+    print(f"URL:        {', '.join(args.urls)}")
     print(f"Format:     {args.format}")
-    print(f"Output:     {args.output}")
+    print(f"Output:     {', '.join(str(output) for output in outputs)}")
     print(f"Work dir:   {args.work_dir}")
     print("=" * 70)
     print()
 
     try:
         # Step 1: Fetch chat content
-        result = fetch_chat(
-            url=args.url,
-            work_dir=args.work_dir,
-            format_type=args.format,
-            keep_html=args.keep_html
-        )
-
-        # Step 2: Consolidate (for markdown format only)
-        if args.format == 'markdown':
-            consolidate_markdown(
-                work_dir=result['work_dir'],
-                output_file=args.output,
-                keep_artifacts=args.keep_artifacts
-            )
-
-            print(f"\n🎉 Success! Your consolidated markdown is ready:")
-            print(f"   {args.output.absolute()}")
+        if len(args.urls) == 1:
+            results = [asyncio.run(fetch_chat(
+                url=args.urls[0],
+                work_dir=args.work_dir,
+                format_type=args.format,
+                keep_html=args.keep_html,
+                keep_artifacts=args.keep_artifacts,
+                interactive=args.interactive,
+                headless=headless
+            ))]
+        else:
+            results = asyncio.run(fetch_chats(
+                urls=args.urls,
+                work_dir=args.work_dir,
+                format_type=args.format,
+                keep_html=args.keep_html,
+                keep_artifacts=args.keep_artifacts,
+                interactive=args.interactive,
+                headless=headless,
+                max_concurrency=args.max_concurrency
+            ))
+
+        failures = 0
+        for url, result, output in zip(args.urls, results, outputs):
+            if isinstance(result, BaseException):
+                failures += 1
+                print(f"\n❌ Failed: {url}")
+                print(f"   {type(result).__name__}: {result}")
+                continue
+
+            # Step 2: Consolidate (for markdown format only)
+            if args.format == 'markdown':
+                consolidate_markdown(
+                    work_dir=result['work_dir'],
+                    output_file=output,
+                    keep_artifacts=args.keep_artifacts,
+                    artifacts=result['artifacts'],
+                    conversation_text=result['conversation_text']
+                )
+
+                print(f"\n🎉 Success! Your consolidated markdown is ready:")
+                print(f"   {output.absolute()}")
+
+            else:  # PDF
+                # Move PDF to final location if different
+                pdf_source = result['work_dir'] / 'chat.pdf'
+                if pdf_source != output:
+                    shutil.move(str(pdf_source), str(output))
+
+                print(f"\n🎉 Success! PDF created:")
+                print(f"   {output.absolute()}")
+
+        if failures:
+            print(f"\n⚠️  {failures} of {len(args.urls)} chats failed")
+
+        if args.format == 'markdown' and failures < len(args.urls):
             print(f"\n💡 This file is optimized for use as context in Claude conversations.")
             print(f"   Simply upload it to your next chat to continue the discussion!")
 
-        else:  # PDF
-            # Move PDF to final location if different
-            pdf_source = result['work_dir'] / 'chat.pdf'
-            if pdf_source != args.output:
-                shutil.move(str(pdf_source), str(args.output))
-
-            print(f"\n🎉 Success! PDF created:")
-            print(f"   {args.output.absolute()}")
-
         print()
-        return 0
+        return 1 if failures else 0
 
     except KeyboardInterrupt:
         print("\n\n❌ Cancelled by user")